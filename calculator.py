@@ -2,6 +2,8 @@
 Simple arithmetic utilities for FlowStateAI.
 
 Implements basic operations with Python 3.11 type hints and safe division.
+Both operands are always passed through ``float()`` so every operation returns
+a plain ``float`` regardless of the numeric type it was given.
 """
 
 from __future__ import annotations
@@ -34,10 +36,10 @@ def divide(a: Numeric, b: Numeric) -> float:
     Raises:
         ValueError: If an attempt is made to divide by zero.
     """
-    try:
-        return float(a) / float(b)
-    except ZeroDivisionError as exc:  # pragma: no cover - defensive branch
-        raise ValueError("Cannot divide by zero.") from exc
+    divisor = float(b)
+    if divisor == 0.0:  # also true for -0.0
+        raise ValueError("Cannot divide by zero.")
+    return float(a) / divisor
 
 
 __all__ = ["add", "subtract", "multiply", "divide", "Numeric"]
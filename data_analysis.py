@@ -5,30 +5,72 @@ Reads newline-delimited JSON event logs and reports:
 - JSON validity (integrity)
 - Event counts by type (keyboard, mouse move, mouse click, mouse scroll)
 - Anomaly checks: timestamp ordering, extreme velocities, negative timings
+
+On request (``--workers``), a log is split on line boundaries and analyzed in
+parallel worker processes; the partial results are merged into one report.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import mmap
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:  # Optional accelerated decoder; falls back to the standard library.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 
 EXTREME_VELOCITY_THRESHOLD = 50_000  # px/s
+READ_CHUNK_SIZE = 64 * 1024  # bytes per read() in _iter_lines
+MAX_EXAMPLES = 8  # examples kept per anomaly type; counts are not capped
+
+# Both ``json.JSONDecodeError`` and ``orjson.JSONDecodeError`` subclass ValueError.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
-def analyze_log(file_path: Path) -> Dict[str, Any]:
+def analyze_log(file_path: Path, workers: int = 1) -> Dict[str, Any]:
     """
     Analyze a newline-delimited JSON log file.
 
     Args:
         file_path: Path to the JSON log file.
+        workers: Number of worker processes to split the file across. The
+            default of 1 analyzes the file in the calling process. Values above
+            1 start a process pool, so on spawn-based platforms (macOS,
+            Windows) the caller's ``__main__`` must be import-safe.
 
     Returns:
-        A dictionary containing counts and anomaly summaries.
+        A dictionary containing counts and anomaly summaries. At most
+        ``MAX_EXAMPLES`` examples are kept per anomaly type (the first ones
+        encountered); the anomaly counts still cover the whole file.
     """
-    stats = {
+    info = file_path.stat()
+    # Pipes and other non-regular inputs cannot be mmapped or seeked; read
+    # them sequentially in this process.
+    if not stat.S_ISREG(info.st_mode):
+        workers = 1
+    ranges = _split_ranges(file_path, info.st_size, workers) if workers > 1 else []
+
+    if len(ranges) < 2:
+        stats, _, _ = _analyze_range(file_path, 0, None)
+        return stats
+
+    starts, ends = zip(*ranges)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        parts = list(pool.map(_analyze_range, repeat(file_path), starts, ends))
+    return _merge_stats(parts)
+
+
+def _new_stats() -> Dict[str, Any]:
+    """Return an empty stats dictionary as produced by ``analyze_log``."""
+    return {
         "total_lines": 0,
         "valid_json": 0,
         "invalid_json": 0,
@@ -52,54 +94,201 @@ def analyze_log(file_path: Path) -> Dict[str, Any]:
         },
     }
 
+
+def _analyze_range(
+    file_path: Path, start: int, end: Optional[int]
+) -> Tuple[Dict[str, Any], Optional[float], Optional[float]]:
+    """
+    Analyze the lines in the byte range ``[start, end)`` of a log file.
+
+    Args:
+        file_path: Path to the JSON log file.
+        start: Offset of the first byte; must be at the start of a line.
+        end: Offset just past the last byte (a line end), or None for EOF.
+
+    Returns:
+        The stats for the range, plus its first and last valid timestamps so
+        that ordering across adjacent ranges can be checked when merging.
+    """
+    stats = _new_stats()
     previous_ts: Optional[float] = None
+    first_ts: Optional[float] = None
 
-    with file_path.open("r", encoding="utf-8") as fp:
-        for line in fp:
-            stats["total_lines"] += 1
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                event = json.loads(line)
-                stats["valid_json"] += 1
-            except json.JSONDecodeError:
-                stats["invalid_json"] += 1
-                continue
+    # Keep the per-event counters and example lists in locals and write the
+    # totals back once at the end, instead of walking nested dicts per event.
+    total_lines = valid_json = invalid_json = 0
+    order_violations = extreme_velocities = negative_timings = 0
+    order_examples = stats["examples"]["timestamp_order"]
+    velocity_examples = stats["examples"]["extreme_velocity"]
+    timing_examples = stats["examples"]["negative_dwell_or_flight"]
+    event_counts = stats["event_counts"]
+    known_event_types = frozenset(event_counts)
 
-            timestamp = _safe_number(event.get("timestamp"))
-            if timestamp is not None and previous_ts is not None and timestamp < previous_ts:
-                stats["anomalies"]["timestamp_order"] += 1
-                stats["examples"]["timestamp_order"].append((previous_ts, timestamp))
-            if timestamp is not None:
-                previous_ts = timestamp
-
-            event_type = event.get("event_type", "other")
-            stats["event_counts"].setdefault(event_type, 0)
-            if event_type in stats["event_counts"]:
-                stats["event_counts"][event_type] += 1
-            else:
-                stats["event_counts"]["other"] += 1
+    for line in _iter_lines(file_path, start, end):
+        total_lines += 1
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            event = _json_loads(line)
+            valid_json += 1
+        except ValueError:
+            invalid_json += 1
+            continue
+
+        # Values are almost always floats or null; only other types pay for
+        # the _safe_number call and its exception handling.
+        timestamp = event.get("timestamp")
+        if type(timestamp) is not float and timestamp is not None:
+            timestamp = _safe_number(timestamp)
+        if timestamp is not None:
+            if previous_ts is None:
+                first_ts = timestamp
+            elif timestamp < previous_ts:
+                order_violations += 1
+                if len(order_examples) < MAX_EXAMPLES:
+                    order_examples.append((previous_ts, timestamp))
+            previous_ts = timestamp
 
+        event_type = event.get("event_type", "other")
+        if event_type not in known_event_types:
+            event_type = "other"
+        event_counts[event_type] += 1
+
+        # Only moves and key events carry fields we check; everything else
+        # stops here without touching its "data" payload.
+        if event_type == "mouse_move":
+            velocity = event.get("data", {}).get("velocity")
+            if type(velocity) is not float and velocity is not None:
+                velocity = _safe_number(velocity)
+            if velocity is not None and velocity > EXTREME_VELOCITY_THRESHOLD:
+                extreme_velocities += 1
+                if len(velocity_examples) < MAX_EXAMPLES:
+                    velocity_examples.append((timestamp, velocity))
+        elif event_type == "key_press" or event_type == "key_release":
             data = event.get("data", {})
-            if event_type == "mouse_move":
-                velocity = _safe_number(data.get("velocity"))
-                if velocity is not None and velocity > EXTREME_VELOCITY_THRESHOLD:
-                    stats["anomalies"]["extreme_velocity"] += 1
-                    stats["examples"]["extreme_velocity"].append((timestamp, velocity))
-            if event_type in {"key_press", "key_release"}:
-                dwell = _safe_number(data.get("dwell_time"))
-                flight = _safe_number(data.get("flight_time"))
-                if dwell is not None and dwell < 0:
-                    stats["anomalies"]["negative_dwell_or_flight"] += 1
-                    stats["examples"]["negative_dwell_or_flight"].append(("dwell_time", dwell))
-                if flight is not None and flight < 0:
-                    stats["anomalies"]["negative_dwell_or_flight"] += 1
-                    stats["examples"]["negative_dwell_or_flight"].append(("flight_time", flight))
+            dwell = data.get("dwell_time")
+            if type(dwell) is not float and dwell is not None:
+                dwell = _safe_number(dwell)
+            flight = data.get("flight_time")
+            if type(flight) is not float and flight is not None:
+                flight = _safe_number(flight)
+            if dwell is not None and dwell < 0:
+                negative_timings += 1
+                if len(timing_examples) < MAX_EXAMPLES:
+                    timing_examples.append(("dwell_time", dwell))
+            if flight is not None and flight < 0:
+                negative_timings += 1
+                if len(timing_examples) < MAX_EXAMPLES:
+                    timing_examples.append(("flight_time", flight))
+
+    stats["total_lines"] = total_lines
+    stats["valid_json"] = valid_json
+    stats["invalid_json"] = invalid_json
+    stats["anomalies"]["timestamp_order"] = order_violations
+    stats["anomalies"]["extreme_velocity"] = extreme_velocities
+    stats["anomalies"]["negative_dwell_or_flight"] = negative_timings
 
+    return stats, first_ts, previous_ts
+
+
+def _split_ranges(file_path: Path, size: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into up to ``parts`` byte ranges that end on a newline.
+
+    Cut points are spread evenly and then moved forward to just past the next
+    ``\\n`` (found via ``mmap`` without reading the file), so no line, including
+    a ``\\r\\n`` pair, is divided between two ranges.
+    """
+    if size == 0:
+        return []
+    ranges: List[Tuple[int, int]] = []
+    start = 0
+    with file_path.open("rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for index in range(1, parts):
+            newline = mm.find(b"\n", max(start, size * index // parts))
+            if newline < 0:
+                break
+            ranges.append((start, newline + 1))
+            start = newline + 1
+    if start < size:
+        ranges.append((start, size))
+    return ranges
+
+
+def _merge_stats(
+    parts: List[Tuple[Dict[str, Any], Optional[float], Optional[float]]]
+) -> Dict[str, Any]:
+    """
+    Merge per-range results from ``_analyze_range`` in file order.
+
+    Counters are summed and examples concatenated (up to ``MAX_EXAMPLES``).
+    A timestamp order violation at each seam, between the last timestamp seen
+    so far and the first one in the next range, is counted as well.
+    """
+    stats = _new_stats()
+    previous_ts: Optional[float] = None
+    for part, first_ts, last_ts in parts:
+        for key in ("total_lines", "valid_json", "invalid_json"):
+            stats[key] += part[key]
+        for event_type, count in part["event_counts"].items():
+            stats["event_counts"][event_type] += count
+
+        if previous_ts is not None and first_ts is not None and first_ts < previous_ts:
+            stats["anomalies"]["timestamp_order"] += 1
+            if len(stats["examples"]["timestamp_order"]) < MAX_EXAMPLES:
+                stats["examples"]["timestamp_order"].append((previous_ts, first_ts))
+        for anomaly, count in part["anomalies"].items():
+            stats["anomalies"][anomaly] += count
+        for anomaly, examples in part["examples"].items():
+            merged = stats["examples"][anomaly]
+            merged.extend(examples[: MAX_EXAMPLES - len(merged)])
+
+        if last_ts is not None:
+            previous_ts = last_ts
     return stats
 
 
+def _iter_lines(
+    file_path: Path, start: int = 0, end: Optional[int] = None
+) -> Iterator[bytearray]:
+    """
+    Yield raw lines from a file, reading it in ``READ_CHUNK_SIZE`` blocks.
+
+    Lines are split with ``bytearray.splitlines`` (same line endings as text
+    mode) and keep their terminators; both JSON decoders accept UTF-8
+    ``bytearray`` input, so no text decoding pass is needed. Memory use is bounded by the chunk size plus
+    the longest line rather than by the file size. Only bytes in
+    ``[start, end)`` are read (to EOF if ``end`` is None).
+    """
+    # Unterminated bytes carried between reads; each byte is copied in once.
+    tail = bytearray()
+    position = start
+    with file_path.open("rb") as fp:
+        if start:
+            fp.seek(start)
+        while True:
+            if end is None:
+                chunk = fp.read(READ_CHUNK_SIZE)
+            else:
+                chunk = fp.read(max(0, min(READ_CHUNK_SIZE, end - position)))
+                position += len(chunk)
+            if not chunk:
+                break
+            # Only the new chunk is searched for the last complete line end. A
+            # trailing "\r" is not one yet: it may be the first half of a
+            # "\r\n" split across two chunks.
+            cut = max(chunk.rfind(b"\n"), chunk.rfind(b"\r", 0, len(chunk) - 1)) + 1
+            if not cut:
+                tail += chunk
+                continue
+            tail += memoryview(chunk)[:cut]
+            yield from tail.splitlines(True)
+            tail = bytearray(memoryview(chunk)[cut:])
+    if tail:
+        yield from tail.splitlines(True)
+
+
 def _safe_number(value: Any) -> Optional[float]:
     """Convert to float if possible; return None otherwise."""
     try:
@@ -150,12 +339,18 @@ def main() -> None:
         description="Analyze FlowStateAI JSON log for integrity and anomalies."
     )
     parser.add_argument("log_path", type=Path, help="Path to JSON log file (newline-delimited).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes to split the log across (default: 1, in-process).",
+    )
     args = parser.parse_args()
 
     if not args.log_path.exists():
         raise FileNotFoundError(f"Log file not found: {args.log_path}")
 
-    stats = analyze_log(args.log_path)
+    stats = analyze_log(args.log_path, workers=args.workers)
     _print_report(stats)
 
 
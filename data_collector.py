@@ -14,10 +14,46 @@ import queue
 import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Optional, Tuple
 
 from pynput import keyboard, mouse
 
+try:  # Optional accelerated encoder; falls back to the standard library.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# Listener callbacks enqueue ``(event_type, timestamp, values)`` tuples; the
+# writer thread expands ``values`` into the ``data`` object using these names.
+_EVENT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "key_press": ("key", "press_time", "flight_time"),
+    "key_release": ("key", "press_time", "release_time", "dwell_time"),
+    "mouse_move": ("x", "y", "velocity"),
+    "mouse_click": ("x", "y", "button", "pressed", "click_interval"),
+    "mouse_scroll": ("x", "y", "dx", "dy"),
+}
+
+_QueuedEvent = Tuple[str, float, Tuple[Any, ...]]
+
+# Upper bound on events drained from the queue per write.
+WRITE_BATCH_SIZE = 256
+
+
+if orjson is not None:
+
+    def _dump_line(record: Dict[str, Any]) -> bytes:
+        """Serialize a record as one UTF-8 JSON line."""
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+
+else:  # pragma: no cover - depends on the environment
+
+    def _dump_line(record: Dict[str, Any]) -> bytes:
+        """Serialize a record as one UTF-8 JSON line."""
+        # Same compact layout as orjson, so files do not depend on the backend.
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        return (line + "\n").encode("utf-8")
+
 
 class AdvancedDataCollector:
     """
@@ -30,22 +66,29 @@ class AdvancedDataCollector:
 
     def __init__(self, base_dir: str | os.PathLike[str] = "sessions") -> None:
         self.base_dir = Path(base_dir)
-        self.session_dir = self.base_dir / time.strftime("%Y-%m-%d")
+        # One snapshot for both names, so a start just before midnight cannot
+        # pair one day's directory with the next day's time of day.
+        started = time.localtime()
+        self.session_dir = self.base_dir / time.strftime("%Y-%m-%d", started)
         self.session_dir.mkdir(parents=True, exist_ok=True)
-        self.session_file = self.session_dir / f"session_{time.strftime('%H%M%S')}.json"
+        self.session_file = self.session_dir / f"session_{time.strftime('%H%M%S', started)}.json"
 
-        self.event_queue: queue.Queue[Optional[Dict[str, Any]]] = queue.Queue()
+        # SimpleQueue is implemented in C and skips Queue's task/maxsize
+        # bookkeeping, which matters for high-rate mouse move events.
+        self.event_queue: queue.SimpleQueue[Optional[_QueuedEvent]] = queue.SimpleQueue()
         self.writer_thread: Optional[threading.Thread] = None
 
         self.keyboard_listener: Optional[keyboard.Listener] = None
         self.mouse_listener: Optional[mouse.Listener] = None
 
-        self.key_press_times: Dict[str, float] = {}
-        self.last_key_release_time: Optional[float] = None
+        # Timing state is kept as integer ``time.time_ns()`` values; intervals
+        # are subtracted exactly and converted to float seconds only on output.
+        self.key_press_ns: Dict[str, int] = {}
+        self.last_key_release_ns: Optional[int] = None
 
         self.last_mouse_pos: Optional[Tuple[int, int]] = None
-        self.last_mouse_move_time: Optional[float] = None
-        self.last_click_time: Optional[float] = None
+        self.last_mouse_move_ns: Optional[int] = None
+        self.last_click_ns: Optional[int] = None
 
         self._running = False
 
@@ -92,143 +135,128 @@ class AdvancedDataCollector:
 
     def _on_press(self, key: keyboard.Key | keyboard.KeyCode) -> None:
         """Handle key press events, including flight time computation."""
-        event_time = time.time()
+        event_ns = time.time_ns()
         key_str = self._key_to_str(key)
         flight_time = (
-            event_time - self.last_key_release_time
-            if self.last_key_release_time is not None
+            (event_ns - self.last_key_release_ns) / 1e9
+            if self.last_key_release_ns is not None
             else None
         )
-        self.key_press_times[key_str] = event_time
-        self._enqueue_event(
-            {
-                "timestamp": event_time,
-                "event_type": "key_press",
-                "data": {
-                    "key": key_str,
-                    "press_time": event_time,
-                    "flight_time": flight_time,
-                },
-            }
-        )
+        self.key_press_ns[key_str] = event_ns
+        event_time = event_ns / 1e9
+        self._enqueue_event("key_press", event_time, (key_str, event_time, flight_time))
 
     def _on_release(self, key: keyboard.Key | keyboard.KeyCode) -> None:
         """Handle key release events, including dwell time computation."""
-        event_time = time.time()
+        event_ns = time.time_ns()
         key_str = self._key_to_str(key)
-        press_time = self.key_press_times.pop(key_str, None)
-        dwell_time = event_time - press_time if press_time is not None else None
+        press_ns = self.key_press_ns.pop(key_str, None)
+        press_time = press_ns / 1e9 if press_ns is not None else None
+        dwell_time = (event_ns - press_ns) / 1e9 if press_ns is not None else None
 
-        self.last_key_release_time = event_time
+        self.last_key_release_ns = event_ns
+        event_time = event_ns / 1e9
         self._enqueue_event(
-            {
-                "timestamp": event_time,
-                "event_type": "key_release",
-                "data": {
-                    "key": key_str,
-                    "press_time": press_time,
-                    "release_time": event_time,
-                    "dwell_time": dwell_time,
-                },
-            }
+            "key_release", event_time, (key_str, press_time, event_time, dwell_time)
         )
 
     def _on_move(self, x: int, y: int) -> None:
         """Handle mouse move events and estimate velocity with throttling."""
-        event_time = time.time()
+        event_ns = time.time_ns()
         velocity = None
 
-        if self.last_mouse_pos is not None and self.last_mouse_move_time is not None:
-            dx = x - self.last_mouse_pos[0]
-            dy = y - self.last_mouse_pos[1]
-            distance = math.hypot(dx, dy)
-            dt = event_time - self.last_mouse_move_time
-            # Throttle to reduce excessive logging: require time or distance threshold.
-            if dt < 0.1 and distance < 5:
+        last_pos = self.last_mouse_pos
+        last_ns = self.last_mouse_move_ns
+        if last_pos is not None and last_ns is not None:
+            dx = x - last_pos[0]
+            dy = y - last_pos[1]
+            dt_ns = event_ns - last_ns
+            # Throttle to reduce excessive logging: require time (0.1 s) or
+            # distance (5 px) threshold. Squared distance keeps the sqrt off
+            # the path of dropped samples.
+            if dt_ns < 100_000_000 and dx * dx + dy * dy < 25:
                 return
-            velocity = distance / dt if dt > 0 else None
+            velocity = math.hypot(dx, dy) / (dt_ns / 1e9) if dt_ns > 0 else None
 
         self.last_mouse_pos = (x, y)
-        self.last_mouse_move_time = event_time
+        self.last_mouse_move_ns = event_ns
 
-        self._enqueue_event(
-            {
-                "timestamp": event_time,
-                "event_type": "mouse_move",
-                "data": {
-                    "x": x,
-                    "y": y,
-                    "velocity": velocity,
-                },
-            }
-        )
+        self._enqueue_event("mouse_move", event_ns / 1e9, (x, y, velocity))
 
     def _on_click(self, x: int, y: int, button: mouse.Button, pressed: bool) -> None:
         """Handle mouse click events and compute click intervals."""
-        event_time = time.time()
+        event_ns = time.time_ns()
         click_interval = (
-            event_time - self.last_click_time if self.last_click_time is not None else None
+            (event_ns - self.last_click_ns) / 1e9 if self.last_click_ns is not None else None
         )
-        self.last_click_time = event_time
+        self.last_click_ns = event_ns
 
         self._enqueue_event(
-            {
-                "timestamp": event_time,
-                "event_type": "mouse_click",
-                "data": {
-                    "x": x,
-                    "y": y,
-                    "button": str(button),
-                    "pressed": pressed,
-                    "click_interval": click_interval,
-                },
-            }
+            "mouse_click", event_ns / 1e9, (x, y, str(button), pressed, click_interval)
         )
 
     def _on_scroll(self, x: int, y: int, dx: int, dy: int) -> None:
         """Handle mouse scroll events."""
-        event_time = time.time()
-        self._enqueue_event(
-            {
-                "timestamp": event_time,
-                "event_type": "mouse_scroll",
-                "data": {"x": x, "y": y, "dx": dx, "dy": dy},
-            }
-        )
+        self._enqueue_event("mouse_scroll", time.time_ns() / 1e9, (x, y, dx, dy))
 
-    def _enqueue_event(self, event: Dict[str, Any]) -> None:
-        """Place an event into the queue with basic protection."""
-        try:
-            self.event_queue.put_nowait(event)
-        except queue.Full:
-            # Drop the event if the queue is unexpectedly full.
-            pass
+    def _enqueue_event(self, event_type: str, timestamp: float, values: Tuple[Any, ...]) -> None:
+        """Place an event into the (unbounded, never blocking) queue."""
+        self.event_queue.put_nowait((event_type, timestamp, values))
 
     def _writer_loop(self) -> None:
-        """Continuously write queued events to the session file."""
+        """
+        Continuously write queued events to the session file.
+
+        Blocks for the next event, then drains whatever else is already queued
+        (up to ``WRITE_BATCH_SIZE``) so bursts of input are written together
+        rather than one event at a time. The file is opened unbuffered, so each
+        batch goes to the OS as a single ``write`` with no extra copy or flush.
+        """
         try:
-            with self.session_file.open("a", encoding="utf-8") as fp:
-                while True:
-                    event = self.event_queue.get()
-                    if event is None:
-                        break
-                    json.dump(event, fp, ensure_ascii=False)
-                    fp.write("\n")
-                    fp.flush()
+            with self.session_file.open("ab", buffering=0) as fp:
+                done = False
+                while not done:
+                    batch = [self.event_queue.get()]
+                    while len(batch) < WRITE_BATCH_SIZE:
+                        try:
+                            batch.append(self.event_queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    if None in batch:
+                        batch = batch[: batch.index(None)]
+                        done = True
+                    if not batch:
+                        continue
+                    payload = b"".join(_dump_line(self._to_record(item)) for item in batch)
+                    self._write_all(fp, payload)
         except OSError:
             # Swallow I/O errors to avoid crashing listeners; in production,
             # integrate with a logging mechanism.
             return
 
+    @staticmethod
+    def _write_all(fp: BinaryIO, payload: bytes) -> None:
+        """Write ``payload`` to an unbuffered file, retrying short writes."""
+        view = memoryview(payload)
+        while view:
+            view = view[fp.write(view) :]
+
+    @staticmethod
+    def _to_record(item: _QueuedEvent) -> Dict[str, Any]:
+        """Expand a queued event tuple into its JSON record."""
+        event_type, timestamp, values = item
+        return {
+            "timestamp": timestamp,
+            "event_type": event_type,
+            "data": dict(zip(_EVENT_FIELDS[event_type], values)),
+        }
+
     @staticmethod
     def _key_to_str(key: keyboard.Key | keyboard.KeyCode) -> str:
         """Convert a pynput key object to a readable string."""
-        try:
-            if hasattr(key, "char") and key.char is not None:
-                return str(key.char)
-            return str(key)
-        except Exception:
-            return "unknown"
+        # KeyCode has a ``char`` (None for dead/unmapped keys); Key does not.
+        char = getattr(key, "char", None)
+        return char if char is not None else str(key)
 
 
 __all__ = ["AdvancedDataCollector"]
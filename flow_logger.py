@@ -2,12 +2,16 @@
 Logging configuration for FlowStateAI.
 
 Provides a reusable logger that writes to both console and file with a
-consistent format. Designed for Python 3.11 with type hints and docstrings.
+consistent format; records are formatted and written by a background
+QueueListener thread. Designed for Python 3.11 with type hints and docstrings.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
 
@@ -23,6 +27,13 @@ def setup_logger(
     """
     Create and configure a logger with console and file handlers.
 
+    The logger itself only carries a ``QueueHandler``; the console and file
+    handlers are driven by a ``QueueListener`` thread, mirroring the collector's
+    writer thread. The caller still builds each record and ``QueueHandler``
+    merges ``msg % args`` (and renders any traceback) before enqueuing it;
+    only the final ``LOG_FORMAT``/``asctime`` formatting and the handler I/O
+    run on the listener thread.
+
     Args:
         name: Logger name to create or retrieve.
         log_file: Path to the log file. Parent directories are created if missing.
@@ -49,15 +60,23 @@ def setup_logger(
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
     file_handler = logging.FileHandler(log_path, encoding="utf-8")
-    file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
 
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Levels are enforced by the logger and the QueueHandler when a record is
+    # logged; the listener writes every record it dequeues, so a later level
+    # change cannot drop records that were already accepted.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    logger.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    listener.start()
+    # Stop (and drain) the listener thread at interpreter exit.
+    atexit.register(listener.stop)
 
     return logger
 
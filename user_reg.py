@@ -2,15 +2,21 @@
 User registration utilities for FlowStateAI.
 
 Collects basic user information with lightweight validation and stores entries
-as dictionaries inside an in-memory list.
+column-wise in parallel in-memory lists.
 """
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from typing import Dict, List
 
 
+# Patterns are compiled once at import and their bound methods reused per call.
+_HAS_NON_SPACE = re.compile(r"\S").search
+_EMAIL_SHAPE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+").fullmatch
+
+
 class ValidationError(ValueError):
     """Raised when provided user data fails validation."""
 
@@ -20,11 +26,17 @@ class UserRegistry:
     """
     Manage user registrations with minimal validation.
 
-    Users are stored as dictionaries in an in-memory list. This is intended for
-    early development and should be replaced with persistent storage as needed.
+    Users are stored column-wise: ``first_names``, ``last_names`` and
+    ``emails`` are parallel lists where index ``i`` describes the same user.
+    Bulk scans (e.g. email lookups) then walk a single list of strings rather
+    than one dictionary per user. Use ``list_users()`` for dictionary records.
+    This is intended for early development and should be replaced with
+    persistent storage as needed.
     """
 
-    users: List[Dict[str, str]] = field(default_factory=list)
+    first_names: List[str] = field(default_factory=list)
+    last_names: List[str] = field(default_factory=list)
+    emails: List[str] = field(default_factory=list)
 
     @staticmethod
     def _validate_field(label: str, value: str) -> str:
@@ -41,10 +53,9 @@ class UserRegistry:
         Raises:
             ValidationError: If the value is empty after trimming whitespace.
         """
-        cleaned = value.strip()
-        if not cleaned:
+        if not _HAS_NON_SPACE(value):
             raise ValidationError(f"{label} cannot be empty.")
-        return cleaned
+        return value.strip()
 
     def add_user(self, first_name: str, last_name: str, email: str) -> Dict[str, str]:
         """
@@ -59,28 +70,46 @@ class UserRegistry:
             The registered user dictionary.
 
         Raises:
-            ValidationError: If any field fails validation.
+            ValidationError: If any field is empty or the email is malformed.
         """
         validated_first = self._validate_field("First name", first_name)
         validated_last = self._validate_field("Last name", last_name)
         validated_email = self._validate_field("Email", email)
+        if not _EMAIL_SHAPE(validated_email):
+            raise ValidationError("Email must look like name@domain.tld.")
 
-        user_record = {
+        self.first_names.append(validated_first)
+        self.last_names.append(validated_last)
+        self.emails.append(validated_email)
+        return {
             "first_name": validated_first,
             "last_name": validated_last,
             "email": validated_email,
         }
-        self.users.append(user_record)
-        return user_record
 
     def list_users(self) -> List[Dict[str, str]]:
         """
-        Return a copy of registered users.
+        Return the registered users.
+
+        Returns:
+            A new list of user dictionaries assembled from the stored columns.
+        """
+        return [
+            {"first_name": first, "last_name": last, "email": email}
+            for first, last, email in zip(self.first_names, self.last_names, self.emails)
+        ]
+
+    def find_by_email_suffix(self, suffix: str) -> List[int]:
+        """
+        Find users whose email address ends with ``suffix``.
+
+        Args:
+            suffix: Case-sensitive suffix to match, e.g. ``"@example.com"``.
 
         Returns:
-            A shallow copy of the registered user dictionaries.
+            Indices of matching users, usable with the column lists.
         """
-        return list(self.users)
+        return [index for index, email in enumerate(self.emails) if email.endswith(suffix)]
 
 
 __all__ = ["UserRegistry", "ValidationError"]